@@ -5,23 +5,24 @@ if os.environ.get("DEBUG", "false").lower() != "true":
 
     monkey.patch_all()
 
-    import grpc.experimental.gevent
+    # grpc is a heavy C extension, only make it gevent-aware when some grpc based client may actually be used
+    if os.environ.get("GEVENT_PATCH_GRPC", "true").lower() == "true":
+        import grpc.experimental.gevent
 
-    grpc.experimental.gevent.init_gevent()
+        grpc.experimental.gevent.init_gevent()
 
-import json
-import logging
-import sys
+import importlib
 import threading
 import time
 import warnings
-from logging.handlers import RotatingFileHandler
 
+import orjson
 from flask import Flask, Response, request
 from flask_cors import CORS
 from werkzeug.exceptions import Unauthorized
 
 import contexts
+from app_factory import create_flask_app_with_configs
 from commands import register_commands
 from configs import dify_config
 
@@ -33,6 +34,7 @@ from extensions import (
     ext_compress,
     ext_database,
     ext_hosting_provider,
+    ext_logging,
     ext_login,
     ext_mail,
     ext_migrate,
@@ -42,7 +44,7 @@ from extensions import (
 )
 from extensions.ext_database import db
 from extensions.ext_login import login_manager
-from libs.passport import PassportService
+from libs.passport import BEARER_TOKEN_PATTERN, PassportService
 
 # TODO: Find a way to avoid importing models here
 from models import account, dataset, model, source, task, tool, tools, web
@@ -59,10 +61,6 @@ if hasattr(time, "tzset"):
     time.tzset()
 
 
-class DifyApp(Flask):
-    pass
-
-
 # -------------
 # Configuration
 # -------------
@@ -76,65 +74,12 @@ config_type = os.getenv("EDITION", default="SELF_HOSTED")  # ce edition first
 # ----------------------------
 
 
-def create_flask_app_with_configs() -> Flask:
-    """
-    create a raw flask app
-    with configs loaded from .env file
-    """
-    dify_app = DifyApp(__name__)
-    dify_app.config.from_mapping(dify_config.model_dump())
-
-    # populate configs into system environment variables
-    for key, value in dify_app.config.items():
-        if isinstance(value, str):
-            os.environ[key] = value
-        elif isinstance(value, int | float | bool):
-            os.environ[key] = str(value)
-        elif value is None:
-            os.environ[key] = ""
-
-    return dify_app
-
-
 def create_app() -> Flask:
     app = create_flask_app_with_configs()
 
     app.secret_key = app.config["SECRET_KEY"]
 
-    log_handlers = None
-    log_file = app.config.get("LOG_FILE")
-    if log_file:
-        log_dir = os.path.dirname(log_file)
-        os.makedirs(log_dir, exist_ok=True)
-        log_handlers = [
-            RotatingFileHandler(
-                filename=log_file,
-                maxBytes=1024 * 1024 * 1024,
-                backupCount=5,
-            ),
-            logging.StreamHandler(sys.stdout),
-        ]
-
-    logging.basicConfig(
-        level=app.config.get("LOG_LEVEL"),
-        format=app.config.get("LOG_FORMAT"),
-        datefmt=app.config.get("LOG_DATEFORMAT"),
-        handlers=log_handlers,
-        force=True,
-    )
-    log_tz = app.config.get("LOG_TZ")
-    if log_tz:
-        from datetime import datetime
-
-        import pytz
-
-        timezone = pytz.timezone(log_tz)
-
-        def time_converter(seconds):
-            return datetime.utcfromtimestamp(seconds).astimezone(timezone).timetuple()
-
-        for handler in logging.root.handlers:
-            handler.formatter.converter = time_converter
+    ext_logging.init_app(app)
     initialize_extensions(app)
     register_blueprints(app)
     register_commands(app)
@@ -158,11 +103,18 @@ def initialize_extensions(app):
     ext_sentry.init_app(app)
 
 
+# blueprints authenticated by console account tokens, other blueprints have their own auth decorators
+CONSOLE_AUTH_BLUEPRINTS = frozenset({"console", "inner_api"})
+
+# stateless, so one instance is shared by all requests
+passport_service = PassportService()
+
+
 # Flask-Login configuration
 @login_manager.request_loader
 def load_user_from_request(request_from_flask_login):
     """Load user based on the request."""
-    if request.blueprint not in {"console", "inner_api"}:
+    if request.blueprint not in CONSOLE_AUTH_BLUEPRINTS:
         return None
     # Check if the user_id contains a dot, indicating the old format
     auth_header = request.headers.get("Authorization", "")
@@ -171,14 +123,12 @@ def load_user_from_request(request_from_flask_login):
         if not auth_token:
             raise Unauthorized("Invalid Authorization token.")
     else:
-        if " " not in auth_header:
-            raise Unauthorized("Invalid Authorization header format. Expected 'Bearer <api-key>' format.")
-        auth_scheme, auth_token = auth_header.split(None, 1)
-        auth_scheme = auth_scheme.lower()
-        if auth_scheme != "bearer":
+        match = BEARER_TOKEN_PATTERN.fullmatch(auth_header)
+        if not match:
             raise Unauthorized("Invalid Authorization header format. Expected 'Bearer <api-key>' format.")
+        auth_token = match.group(1)
 
-    decoded = PassportService().verify(auth_token)
+    decoded = passport_service.verify(auth_token)
     user_id = decoded.get("user_id")
 
     account = AccountService.load_logged_in_account(account_id=user_id, token=auth_token)
@@ -191,7 +141,7 @@ def load_user_from_request(request_from_flask_login):
 def unauthorized_handler():
     """Handle unauthorized requests."""
     return Response(
-        json.dumps({"code": "unauthorized", "message": "Unauthorized."}),
+        orjson.dumps({"code": "unauthorized", "message": "Unauthorized."}),
         status=401,
         content_type="application/json",
     )
@@ -199,45 +149,55 @@ def unauthorized_handler():
 
 # register blueprint routers
 def register_blueprints(app):
-    from controllers.console import bp as console_app_bp
-    from controllers.files import bp as files_bp
-    from controllers.inner_api import bp as inner_api_bp
-    from controllers.service_api import bp as service_api_bp
-    from controllers.web import bp as web_bp
-
-    CORS(
-        service_api_bp,
-        allow_headers=["Content-Type", "Authorization", "X-App-Code"],
-        methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"],
-    )
-    app.register_blueprint(service_api_bp)
-
-    CORS(
-        web_bp,
-        resources={r"/*": {"origins": app.config["WEB_API_CORS_ALLOW_ORIGINS"]}},
-        supports_credentials=True,
-        allow_headers=["Content-Type", "Authorization", "X-App-Code"],
-        methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"],
-        expose_headers=["X-Version", "X-Env"],
-    )
+    enabled_blueprints = set(dify_config.ENABLED_BLUEPRINTS)
 
-    app.register_blueprint(web_bp)
+    def load_blueprint(name: str):
+        # controllers are imported only when their blueprint is enabled
+        return importlib.import_module(f"controllers.{name}").bp
 
-    CORS(
-        console_app_bp,
-        resources={r"/*": {"origins": app.config["CONSOLE_CORS_ALLOW_ORIGINS"]}},
-        supports_credentials=True,
-        allow_headers=["Content-Type", "Authorization"],
-        methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"],
-        expose_headers=["X-Version", "X-Env"],
-    )
+    # CORS(blueprint) installs its hook on the blueprint itself,
+    # so each response only runs the CORS handling of its own blueprint
 
-    app.register_blueprint(console_app_bp)
+    if "service_api" in enabled_blueprints:
+        service_api_bp = load_blueprint("service_api")
+        CORS(
+            service_api_bp,
+            allow_headers=["Content-Type", "Authorization", "X-App-Code"],
+            methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"],
+        )
+        app.register_blueprint(service_api_bp)
+
+    if "web" in enabled_blueprints:
+        web_bp = load_blueprint("web")
+        CORS(
+            web_bp,
+            resources={r"/*": {"origins": app.config["WEB_API_CORS_ALLOW_ORIGINS"]}},
+            supports_credentials=True,
+            allow_headers=["Content-Type", "Authorization", "X-App-Code"],
+            methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"],
+            expose_headers=["X-Version", "X-Env"],
+        )
+        app.register_blueprint(web_bp)
+
+    if "console" in enabled_blueprints:
+        console_app_bp = load_blueprint("console")
+        CORS(
+            console_app_bp,
+            resources={r"/*": {"origins": app.config["CONSOLE_CORS_ALLOW_ORIGINS"]}},
+            supports_credentials=True,
+            allow_headers=["Content-Type", "Authorization"],
+            methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"],
+            expose_headers=["X-Version", "X-Env"],
+        )
+        app.register_blueprint(console_app_bp)
 
-    CORS(files_bp, allow_headers=["Content-Type"], methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"])
-    app.register_blueprint(files_bp)
+    if "files" in enabled_blueprints:
+        files_bp = load_blueprint("files")
+        CORS(files_bp, allow_headers=["Content-Type"], methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"])
+        app.register_blueprint(files_bp)
 
-    app.register_blueprint(inner_api_bp)
+    if "inner_api" in enabled_blueprints:
+        app.register_blueprint(load_blueprint("inner_api"))
 
 
 # create app
@@ -247,20 +207,26 @@ celery = app.extensions["celery"]
 if app.config.get("TESTING"):
     print("App is running in TESTING mode")
 
+# values added to every response, read once from the config
+CURRENT_VERSION = app.config["CURRENT_VERSION"]
+DEPLOY_ENV = app.config["DEPLOY_ENV"]
+
 
 @app.after_request
 def after_request(response):
     """Add Version headers to the response."""
-    response.set_cookie("remember_token", "", expires=0)
-    response.headers.add("X-Version", app.config["CURRENT_VERSION"])
-    response.headers.add("X-Env", app.config["DEPLOY_ENV"])
+    # remember cookies are never issued, only clear the ones still kept by clients
+    if "remember_token" in request.cookies:
+        response.set_cookie("remember_token", "", expires=0)
+    response.headers["X-Version"] = CURRENT_VERSION
+    response.headers["X-Env"] = DEPLOY_ENV
     return response
 
 
 @app.route("/health")
 def health():
     return Response(
-        json.dumps({"pid": os.getpid(), "status": "ok", "version": app.config["CURRENT_VERSION"]}),
+        orjson.dumps({"pid": os.getpid(), "status": "ok", "version": CURRENT_VERSION}),
         status=200,
         content_type="application/json",
     )
@@ -268,42 +234,42 @@ def health():
 
 @app.route("/threads")
 def threads():
-    num_threads = threading.active_count()
+    # a single snapshot of the threads, so the thread count matches the listed threads
     threads = threading.enumerate()
+    thread_list = [{"name": thread.name, "id": thread.ident, "is_alive": thread.is_alive()} for thread in threads]
 
-    thread_list = []
-    for thread in threads:
-        thread_name = thread.name
-        thread_id = thread.ident
-        is_alive = thread.is_alive()
-
-        thread_list.append(
+    return Response(
+        orjson.dumps(
             {
-                "name": thread_name,
-                "id": thread_id,
-                "is_alive": is_alive,
+                "pid": os.getpid(),
+                "thread_num": len(threads),
+                "threads": thread_list,
             }
-        )
-
-    return {
-        "pid": os.getpid(),
-        "thread_num": num_threads,
-        "threads": thread_list,
-    }
+        ),
+        status=200,
+        content_type="application/json",
+    )
 
 
 @app.route("/db-pool-stat")
 def pool_stat():
-    engine = db.engine
-    return {
-        "pid": os.getpid(),
-        "pool_size": engine.pool.size(),
-        "checked_in_connections": engine.pool.checkedin(),
-        "checked_out_connections": engine.pool.checkedout(),
-        "overflow_connections": engine.pool.overflow(),
-        "connection_timeout": engine.pool.timeout(),
-        "recycle_time": db.engine.pool._recycle,
-    }
+    # db.engine looks the engine up through the app context, resolve the pool once
+    pool = db.engine.pool
+    return Response(
+        orjson.dumps(
+            {
+                "pid": os.getpid(),
+                "pool_size": pool.size(),
+                "checked_in_connections": pool.checkedin(),
+                "checked_out_connections": pool.checkedout(),
+                "overflow_connections": pool.overflow(),
+                "connection_timeout": pool.timeout(),
+                "recycle_time": pool._recycle,
+            }
+        ),
+        status=200,
+        content_type="application/json",
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+from flask import Flask
+
+from configs import dify_config
+
+
+class DifyApp(Flask):
+    pass
+
+
+def create_flask_app_with_configs() -> Flask:
+    """
+    create a raw flask app
+    with configs loaded from .env file
+    """
+    dify_app = DifyApp(__name__)
+    dify_app.config.from_mapping(dify_config.model_dump())
+
+    return dify_app
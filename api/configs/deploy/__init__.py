@@ -1,5 +1,7 @@
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from functools import cached_property
+
+from pydantic import AliasChoices, Field, computed_field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class DeploymentConfig(BaseSettings):
@@ -7,6 +9,8 @@ class DeploymentConfig(BaseSettings):
     Configuration settings for application deployment
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     APPLICATION_NAME: str = Field(
         description="Name of the application, used for identification and logging purposes",
         default="langgenius/dify",
@@ -31,3 +35,15 @@ class DeploymentConfig(BaseSettings):
         description="Deployment environment (e.g., 'PRODUCTION', 'DEVELOPMENT'), default to PRODUCTION",
         default="PRODUCTION",
     )
+
+    inner_ENABLED_BLUEPRINTS: str = Field(
+        description="Comma-separated blueprints to register (console, web, service_api, files, inner_api),"
+        " processes serving no HTTP requests (e.g., Celery workers) can set it to empty to skip loading controllers",
+        validation_alias=AliasChoices("ENABLED_BLUEPRINTS"),
+        default="console,web,service_api,files,inner_api",
+    )
+
+    @computed_field
+    @cached_property
+    def ENABLED_BLUEPRINTS(self) -> list[str]:
+        return [name.strip() for name in self.inner_ENABLED_BLUEPRINTS.split(",") if name.strip()]
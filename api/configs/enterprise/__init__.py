@@ -1,5 +1,5 @@
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class EnterpriseFeatureConfig(BaseSettings):
@@ -8,6 +8,8 @@ class EnterpriseFeatureConfig(BaseSettings):
     **Before using, please contact business@dify.ai by email to inquire about licensing matters.**
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     ENTERPRISE_ENABLED: bool = Field(
         description="Enable or disable enterprise-level features."
         "Before using, please contact business@dify.ai by email to inquire about licensing matters.",
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class NotionConfig(BaseSettings):
@@ -9,6 +9,8 @@ class NotionConfig(BaseSettings):
     Configuration settings for Notion integration
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     NOTION_CLIENT_ID: Optional[str] = Field(
         description="Client ID for Notion API authentication. Required for OAuth 2.0 flow.",
         default=None,
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, NonNegativeFloat
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class SentryConfig(BaseSettings):
@@ -9,6 +9,8 @@ class SentryConfig(BaseSettings):
     Configuration settings for Sentry error tracking and performance monitoring
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     SENTRY_DSN: Optional[str] = Field(
         description="Sentry Data Source Name (DSN)."
         " This is the unique identifier of your Sentry project, used to send events to the correct project.",
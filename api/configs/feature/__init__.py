@@ -1,7 +1,8 @@
-from typing import Annotated, Optional
+from functools import cached_property
+from typing import Annotated, Literal, Optional
 
-from pydantic import AliasChoices, Field, HttpUrl, NegativeInt, NonNegativeInt, PositiveInt, computed_field
-from pydantic_settings import BaseSettings
+from pydantic import AliasChoices, Field, NegativeInt, NonNegativeInt, PositiveInt, computed_field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from configs.feature.hosted_service import HostedServiceConfig
 
@@ -11,6 +12,8 @@ class SecurityConfig(BaseSettings):
     Security-related configurations for the application
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     SECRET_KEY: Optional[str] = Field(
         description="Secret key for secure session cookie signing."
         "Make sure you are changing this key for your deployment with a strong key."
@@ -29,6 +32,8 @@ class AppExecutionConfig(BaseSettings):
     Configuration parameters for application execution
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     APP_MAX_EXECUTION_TIME: PositiveInt = Field(
         description="Maximum allowed execution time for the application in seconds",
         default=1200,
@@ -44,8 +49,11 @@ class CodeExecutionSandboxConfig(BaseSettings):
     Configuration for the code execution sandbox environment
     """
 
-    CODE_EXECUTION_ENDPOINT: HttpUrl = Field(
+    model_config = SettingsConfigDict(defer_build=True)
+
+    CODE_EXECUTION_ENDPOINT: str = Field(
         description="URL endpoint for the code execution service",
+        pattern=r"^https?://",
         default="http://sandbox:8194",
     )
 
@@ -115,6 +123,8 @@ class EndpointConfig(BaseSettings):
     Configuration for various application endpoints and URLs
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     CONSOLE_API_URL: str = Field(
         description="Base URL for the console API,"
         "used for login authentication callback or notion integration callbacks",
@@ -142,6 +152,8 @@ class FileAccessConfig(BaseSettings):
     Configuration for file access and handling
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     FILES_URL: str = Field(
         description="Base URL for file preview or download,"
         " used for frontend display and multi-model inputs"
@@ -162,6 +174,8 @@ class FileUploadConfig(BaseSettings):
     Configuration for file upload limitations
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     UPLOAD_FILE_SIZE_LIMIT: NonNegativeInt = Field(
         description="Maximum allowed file size for uploads in megabytes",
         default=15,
@@ -188,6 +202,8 @@ class HttpConfig(BaseSettings):
     HTTP-related configurations for the application
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     API_COMPRESSION_ENABLED: bool = Field(
         description="Enable or disable gzip compression for HTTP responses",
         default=False,
@@ -200,7 +216,7 @@ class HttpConfig(BaseSettings):
     )
 
     @computed_field
-    @property
+    @cached_property
     def CONSOLE_CORS_ALLOW_ORIGINS(self) -> list[str]:
         return self.inner_CONSOLE_CORS_ALLOW_ORIGINS.split(",")
 
@@ -211,7 +227,7 @@ class HttpConfig(BaseSettings):
     )
 
     @computed_field
-    @property
+    @cached_property
     def WEB_API_CORS_ALLOW_ORIGINS(self) -> list[str]:
         return self.inner_WEB_API_CORS_ALLOW_ORIGINS.split(",")
 
@@ -253,6 +269,8 @@ class InnerAPIConfig(BaseSettings):
     Configuration for internal API functionality
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     INNER_API: bool = Field(
         description="Enable or disable the internal API",
         default=False,
@@ -269,6 +287,8 @@ class LoggingConfig(BaseSettings):
     Configuration for application logging
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     LOG_LEVEL: str = Field(
         description="Logging level, default to INFO. Set to ERROR for production environments.",
         default="INFO",
@@ -300,6 +320,8 @@ class ModelLoadBalanceConfig(BaseSettings):
     Configuration for model load balancing
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     MODEL_LB_ENABLED: bool = Field(
         description="Enable or disable load balancing for models",
         default=False,
@@ -311,6 +333,8 @@ class BillingConfig(BaseSettings):
     Configuration for platform billing features
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     BILLING_ENABLED: bool = Field(
         description="Enable or disable billing functionality",
         default=False,
@@ -322,6 +346,8 @@ class UpdateConfig(BaseSettings):
     Configuration for application update checks
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     CHECK_UPDATE_URL: str = Field(
         description="URL to check for application updates",
         default="https://updates.dify.ai",
@@ -333,6 +359,8 @@ class WorkflowConfig(BaseSettings):
     Configuration for workflow execution
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     WORKFLOW_MAX_EXECUTION_STEPS: PositiveInt = Field(
         description="Maximum number of steps allowed in a single workflow execution",
         default=500,
@@ -359,6 +387,8 @@ class OAuthConfig(BaseSettings):
     Configuration for OAuth authentication
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     OAUTH_REDIRECT_PATH: str = Field(
         description="Redirect path for OAuth authentication callbacks",
         default="/console/api/oauth/authorize",
@@ -390,6 +420,8 @@ class ModerationConfig(BaseSettings):
     Configuration for content moderation
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     MODERATION_BUFFER_SIZE: PositiveInt = Field(
         description="Size of the buffer for content moderation processing",
         default=300,
@@ -401,6 +433,8 @@ class ToolConfig(BaseSettings):
     Configuration for tool management
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     TOOL_ICON_CACHE_MAX_AGE: PositiveInt = Field(
         description="Maximum age in seconds for caching tool icons",
         default=3600,
@@ -412,6 +446,8 @@ class MailConfig(BaseSettings):
     Configuration for email services
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     MAIL_TYPE: Optional[str] = Field(
         description="Email service provider type ('smtp' or 'resend'), default to None.",
         default=None,
@@ -468,7 +504,9 @@ class RagEtlConfig(BaseSettings):
     Configuration for RAG ETL processes
     """
 
-    ETL_TYPE: str = Field(
+    model_config = SettingsConfigDict(defer_build=True)
+
+    ETL_TYPE: Literal["dify", "Unstructured"] = Field(
         description="RAG ETL type ('dify' or 'Unstructured'), default to 'dify'",
         default="dify",
     )
@@ -495,6 +533,8 @@ class DataSetConfig(BaseSettings):
     Configuration for dataset management
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     CLEAN_DAY_SETTING: PositiveInt = Field(
         description="Interval in days for dataset cleanup operations",
         default=30,
@@ -511,6 +551,8 @@ class WorkspaceConfig(BaseSettings):
     Configuration for workspace management
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     INVITE_EXPIRY_HOURS: PositiveInt = Field(
         description="Expiration time in hours for workspace invitation links",
         default=72,
@@ -522,6 +564,8 @@ class IndexingConfig(BaseSettings):
     Configuration for indexing operations
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     INDEXING_MAX_SEGMENTATION_TOKENS_LENGTH: PositiveInt = Field(
         description="Maximum token length for text segmentation during indexing",
         default=1000,
@@ -529,20 +573,30 @@ class IndexingConfig(BaseSettings):
 
 
 class ImageFormatConfig(BaseSettings):
-    MULTIMODAL_SEND_IMAGE_FORMAT: str = Field(
+    model_config = SettingsConfigDict(defer_build=True)
+
+    MULTIMODAL_SEND_IMAGE_FORMAT: Literal["base64", "url"] = Field(
         description="Format for sending images in multimodal contexts ('base64' or 'url'), default is base64",
         default="base64",
     )
 
 
 class CeleryBeatConfig(BaseSettings):
+    model_config = SettingsConfigDict(defer_build=True)
+
     CELERY_BEAT_SCHEDULER_TIME: int = Field(
         description="Interval in days for Celery Beat scheduler execution, default to 1 day",
         default=1,
     )
 
 
+def _split_csv_to_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip() != ""]
+
+
 class PositionConfig(BaseSettings):
+    model_config = SettingsConfigDict(defer_build=True)
+
     POSITION_PROVIDER_PINS: str = Field(
         description="Comma-separated list of pinned model providers",
         default="",
@@ -574,28 +628,34 @@ class PositionConfig(BaseSettings):
     )
 
     @computed_field
+    @cached_property
     def POSITION_PROVIDER_PINS_LIST(self) -> list[str]:
-        return [item.strip() for item in self.POSITION_PROVIDER_PINS.split(",") if item.strip() != ""]
+        return _split_csv_to_list(self.POSITION_PROVIDER_PINS)
 
     @computed_field
+    @cached_property
     def POSITION_PROVIDER_INCLUDES_SET(self) -> set[str]:
-        return {item.strip() for item in self.POSITION_PROVIDER_INCLUDES.split(",") if item.strip() != ""}
+        return set(_split_csv_to_list(self.POSITION_PROVIDER_INCLUDES))
 
     @computed_field
+    @cached_property
     def POSITION_PROVIDER_EXCLUDES_SET(self) -> set[str]:
-        return {item.strip() for item in self.POSITION_PROVIDER_EXCLUDES.split(",") if item.strip() != ""}
+        return set(_split_csv_to_list(self.POSITION_PROVIDER_EXCLUDES))
 
     @computed_field
+    @cached_property
     def POSITION_TOOL_PINS_LIST(self) -> list[str]:
-        return [item.strip() for item in self.POSITION_TOOL_PINS.split(",") if item.strip() != ""]
+        return _split_csv_to_list(self.POSITION_TOOL_PINS)
 
     @computed_field
+    @cached_property
     def POSITION_TOOL_INCLUDES_SET(self) -> set[str]:
-        return {item.strip() for item in self.POSITION_TOOL_INCLUDES.split(",") if item.strip() != ""}
+        return set(_split_csv_to_list(self.POSITION_TOOL_INCLUDES))
 
     @computed_field
+    @cached_property
     def POSITION_TOOL_EXCLUDES_SET(self) -> set[str]:
-        return {item.strip() for item in self.POSITION_TOOL_EXCLUDES.split(",") if item.strip() != ""}
+        return set(_split_csv_to_list(self.POSITION_TOOL_EXCLUDES))
 
 
 class FeatureConfig(
@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field, NonNegativeInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class HostedOpenAiConfig(BaseSettings):
@@ -9,6 +9,8 @@ class HostedOpenAiConfig(BaseSettings):
     Configuration for hosted OpenAI service
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     HOSTED_OPENAI_API_KEY: Optional[str] = Field(
         description="API key for hosted OpenAI service",
         default=None,
@@ -74,6 +76,8 @@ class HostedAzureOpenAiConfig(BaseSettings):
     Configuration for hosted Azure OpenAI service
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     HOSTED_AZURE_OPENAI_ENABLED: bool = Field(
         description="Enable hosted Azure OpenAI service",
         default=False,
@@ -100,6 +104,8 @@ class HostedAnthropicConfig(BaseSettings):
     Configuration for hosted Anthropic service
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     HOSTED_ANTHROPIC_API_BASE: Optional[str] = Field(
         description="Base URL for hosted Anthropic API",
         default=None,
@@ -131,6 +137,8 @@ class HostedMinmaxConfig(BaseSettings):
     Configuration for hosted Minmax service
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     HOSTED_MINIMAX_ENABLED: bool = Field(
         description="Enable hosted Minmax service",
         default=False,
@@ -142,6 +150,8 @@ class HostedSparkConfig(BaseSettings):
     Configuration for hosted Spark service
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     HOSTED_SPARK_ENABLED: bool = Field(
         description="Enable hosted Spark service",
         default=False,
@@ -153,6 +163,8 @@ class HostedZhipuAIConfig(BaseSettings):
     Configuration for hosted ZhipuAI service
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     HOSTED_ZHIPUAI_ENABLED: bool = Field(
         description="Enable hosted ZhipuAI service",
         default=False,
@@ -164,6 +176,8 @@ class HostedModerationConfig(BaseSettings):
     Configuration for hosted Moderation service
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     HOSTED_MODERATION_ENABLED: bool = Field(
         description="Enable hosted Moderation service",
         default=False,
@@ -180,7 +194,9 @@ class HostedFetchAppTemplateConfig(BaseSettings):
     Configuration for fetching app templates
     """
 
-    HOSTED_FETCH_APP_TEMPLATES_MODE: str = Field(
+    model_config = SettingsConfigDict(defer_build=True)
+
+    HOSTED_FETCH_APP_TEMPLATES_MODE: Literal["remote", "db", "builtin"] = Field(
         description="Mode for fetching app templates: remote, db, or builtin" " default to remote,",
         default="remote",
     )
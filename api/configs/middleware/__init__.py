@@ -1,8 +1,9 @@
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any, Literal, Optional
 from urllib.parse import quote_plus
 
 from pydantic import Field, NonNegativeInt, PositiveFloat, PositiveInt, computed_field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from configs.middleware.cache.redis_config import RedisConfig
 from configs.middleware.storage.aliyun_oss_storage_config import AliyunOSSStorageConfig
@@ -30,6 +31,8 @@ from configs.middleware.vdb.weaviate_config import WeaviateConfig
 
 
 class StorageConfig(BaseSettings):
+    model_config = SettingsConfigDict(defer_build=True)
+
     STORAGE_TYPE: str = Field(
         description="Type of storage to use."
         " Options: 'local', 's3', 'azure-blob', 'aliyun-oss', 'google-storage'. Default is 'local'.",
@@ -43,6 +46,8 @@ class StorageConfig(BaseSettings):
 
 
 class VectorStoreConfig(BaseSettings):
+    model_config = SettingsConfigDict(defer_build=True)
+
     VECTOR_STORE: Optional[str] = Field(
         description="Type of vector store to use for efficient similarity search."
         " Set to None if not using a vector store.",
@@ -51,7 +56,9 @@ class VectorStoreConfig(BaseSettings):
 
 
 class KeywordStoreConfig(BaseSettings):
-    KEYWORD_STORE: str = Field(
+    model_config = SettingsConfigDict(defer_build=True)
+
+    KEYWORD_STORE: Literal["jieba"] = Field(
         description="Method for keyword extraction and storage."
         " Default is 'jieba', a Chinese text segmentation library.",
         default="jieba",
@@ -100,7 +107,7 @@ class DatabaseConfig:
     )
 
     @computed_field
-    @property
+    @cached_property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
         db_extras = (
             f"{self.DB_EXTRAS}&client_encoding={self.DB_CHARSET}" if self.DB_CHARSET else self.DB_EXTRAS
@@ -138,7 +145,7 @@ class DatabaseConfig:
     )
 
     @computed_field
-    @property
+    @cached_property
     def SQLALCHEMY_ENGINE_OPTIONS(self) -> dict[str, Any]:
         return {
             "pool_size": self.SQLALCHEMY_POOL_SIZE,
@@ -176,7 +183,7 @@ class CeleryConfig(DatabaseConfig):
     )
 
     @computed_field
-    @property
+    @cached_property
     def CELERY_RESULT_BACKEND(self) -> str | None:
         return (
             "db+{}".format(self.SQLALCHEMY_DATABASE_URI)
@@ -185,7 +192,7 @@ class CeleryConfig(DatabaseConfig):
         )
 
     @computed_field
-    @property
+    @cached_property
     def BROKER_USE_SSL(self) -> bool:
         return self.CELERY_BROKER_URL.startswith("rediss://") if self.CELERY_BROKER_URL else False
 
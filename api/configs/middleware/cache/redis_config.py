@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, NonNegativeInt, PositiveFloat, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class RedisConfig(BaseSettings):
@@ -9,6 +9,8 @@ class RedisConfig(BaseSettings):
     Configuration settings for Redis connection
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     REDIS_HOST: str = Field(
         description="Hostname or IP address of the Redis server",
         default="localhost",
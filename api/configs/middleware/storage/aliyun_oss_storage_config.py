@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class AliyunOSSStorageConfig(BaseSettings):
@@ -9,6 +9,8 @@ class AliyunOSSStorageConfig(BaseSettings):
     Configuration settings for Aliyun Object Storage Service (OSS)
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     ALIYUN_OSS_BUCKET_NAME: Optional[str] = Field(
         description="Name of the Aliyun OSS bucket to store and retrieve objects",
         default=None,
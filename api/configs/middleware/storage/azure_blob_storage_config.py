@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class AzureBlobStorageConfig(BaseSettings):
@@ -9,6 +9,8 @@ class AzureBlobStorageConfig(BaseSettings):
     Configuration settings for Azure Blob Storage
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     AZURE_BLOB_ACCOUNT_NAME: Optional[str] = Field(
         description="Name of the Azure Storage account (e.g., 'mystorageaccount')",
         default=None,
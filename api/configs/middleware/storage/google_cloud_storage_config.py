@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class GoogleCloudStorageConfig(BaseSettings):
@@ -9,6 +9,8 @@ class GoogleCloudStorageConfig(BaseSettings):
     Configuration settings for Google Cloud Storage
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     GOOGLE_STORAGE_BUCKET_NAME: Optional[str] = Field(
         description="Name of the Google Cloud Storage bucket to store and retrieve objects (e.g., 'my-gcs-bucket')",
         default=None,
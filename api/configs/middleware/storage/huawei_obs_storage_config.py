@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HuaweiCloudOBSStorageConfig(BaseModel):
@@ -8,6 +8,8 @@ class HuaweiCloudOBSStorageConfig(BaseModel):
     Configuration settings for Huawei Cloud Object Storage Service (OBS)
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     HUAWEI_OBS_BUCKET_NAME: Optional[str] = Field(
         description="Name of the Huawei Cloud OBS bucket to store and retrieve objects (e.g., 'my-obs-bucket')",
         default=None,
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class TencentCloudCOSStorageConfig(BaseSettings):
@@ -9,6 +9,8 @@ class TencentCloudCOSStorageConfig(BaseSettings):
     Configuration settings for Tencent Cloud Object Storage (COS)
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     TENCENT_COS_BUCKET_NAME: Optional[str] = Field(
         description="Name of the Tencent Cloud COS bucket to store and retrieve objects",
         default=None,
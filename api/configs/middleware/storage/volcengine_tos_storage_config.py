@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VolcengineTOSStorageConfig(BaseModel):
@@ -8,6 +8,8 @@ class VolcengineTOSStorageConfig(BaseModel):
     Configuration settings for Volcengine Tinder Object Storage (TOS)
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     VOLCENGINE_TOS_BUCKET_NAME: Optional[str] = Field(
         description="Name of the Volcengine TOS bucket to store and retrieve objects (e.g., 'my-tos-bucket')",
         default=None,
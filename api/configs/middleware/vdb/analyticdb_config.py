@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AnalyticdbConfig(BaseModel):
@@ -10,6 +10,8 @@ class AnalyticdbConfig(BaseModel):
     https://www.alibabacloud.com/help/en/analyticdb-for-postgresql/getting-started/create-an-instance-instances-with-vector-engine-optimization-enabled
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     ANALYTICDB_KEY_ID: Optional[str] = Field(
         default=None, description="The Access Key ID provided by Alibaba Cloud for API authentication."
     )
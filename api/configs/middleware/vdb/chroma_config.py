@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class ChromaConfig(BaseSettings):
@@ -9,6 +9,8 @@ class ChromaConfig(BaseSettings):
     Configuration settings for Chroma vector database
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     CHROMA_HOST: Optional[str] = Field(
         description="Hostname or IP address of the Chroma server (e.g., 'localhost' or '192.168.1.100')",
         default=None,
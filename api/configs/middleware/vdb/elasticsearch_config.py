@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class ElasticsearchConfig(BaseSettings):
@@ -9,6 +9,8 @@ class ElasticsearchConfig(BaseSettings):
     Configuration settings for Elasticsearch
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     ELASTICSEARCH_HOST: Optional[str] = Field(
         description="Hostname or IP address of the Elasticsearch server (e.g., 'localhost' or '192.168.1.100')",
         default="127.0.0.1",
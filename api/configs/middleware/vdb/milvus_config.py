@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class MilvusConfig(BaseSettings):
@@ -9,6 +9,8 @@ class MilvusConfig(BaseSettings):
     Configuration settings for Milvus vector database
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     MILVUS_URI: Optional[str] = Field(
         description="URI for connecting to the Milvus server (e.g., 'http://localhost:19530' or 'https://milvus-instance.example.com:19530')",
         default="http://127.0.0.1:19530",
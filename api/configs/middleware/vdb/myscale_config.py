@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
 
 
 class MyScaleConfig(BaseModel):
@@ -6,6 +6,8 @@ class MyScaleConfig(BaseModel):
     Configuration settings for MyScale vector database
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     MYSCALE_HOST: str = Field(
         description="Hostname or IP address of the MyScale server (e.g., 'localhost' or 'myscale.example.com')",
         default="localhost",
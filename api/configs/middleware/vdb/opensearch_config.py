@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class OpenSearchConfig(BaseSettings):
@@ -9,6 +9,8 @@ class OpenSearchConfig(BaseSettings):
     Configuration settings for OpenSearch
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     OPENSEARCH_HOST: Optional[str] = Field(
         description="Hostname or IP address of the OpenSearch server (e.g., 'localhost' or 'opensearch.example.com')",
         default=None,
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class OracleConfig(BaseSettings):
@@ -9,6 +9,8 @@ class OracleConfig(BaseSettings):
     Configuration settings for Oracle database
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     ORACLE_HOST: Optional[str] = Field(
         description="Hostname or IP address of the Oracle database server (e.g., 'localhost' or 'oracle.example.com')",
         default=None,
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class PGVectorConfig(BaseSettings):
@@ -9,6 +9,8 @@ class PGVectorConfig(BaseSettings):
     Configuration settings for PGVector (PostgreSQL with vector extension)
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     PGVECTOR_HOST: Optional[str] = Field(
         description="Hostname or IP address of the PostgreSQL server with PGVector extension (e.g., 'localhost')",
         default=None,
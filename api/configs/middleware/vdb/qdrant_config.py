@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, NonNegativeInt, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class QdrantConfig(BaseSettings):
@@ -9,6 +9,8 @@ class QdrantConfig(BaseSettings):
     Configuration settings for Qdrant vector database
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     QDRANT_URL: Optional[str] = Field(
         description="URL of the Qdrant server (e.g., 'http://localhost:6333' or 'https://qdrant.example.com')",
         default=None,
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class RelytConfig(BaseSettings):
@@ -9,6 +9,8 @@ class RelytConfig(BaseSettings):
     Configuration settings for Relyt database
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     RELYT_HOST: Optional[str] = Field(
         description="Hostname or IP address of the Relyt server (e.g., 'localhost' or 'relyt.example.com')",
         default=None,
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, NonNegativeInt, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class TencentVectorDBConfig(BaseSettings):
@@ -9,6 +9,8 @@ class TencentVectorDBConfig(BaseSettings):
     Configuration settings for Tencent Vector Database
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     TENCENT_VECTOR_DB_URL: Optional[str] = Field(
         description="URL of the Tencent Vector Database service (e.g., 'https://vectordb.tencentcloudapi.com')",
         default=None,
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from pydantic import Field, PositiveInt
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class WeaviateConfig(BaseSettings):
@@ -9,6 +9,8 @@ class WeaviateConfig(BaseSettings):
     Configuration settings for Weaviate vector database
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     WEAVIATE_ENDPOINT: Optional[str] = Field(
         description="URL of the Weaviate server (e.g., 'http://localhost:8080' or 'https://weaviate.example.com')",
         default=None,
@@ -1,5 +1,5 @@
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class PackagingInfo(BaseSettings):
@@ -7,6 +7,8 @@ class PackagingInfo(BaseSettings):
     Packaging build information
     """
 
+    model_config = SettingsConfigDict(defer_build=True)
+
     CURRENT_VERSION: str = Field(
         description="Dify version",
         default="0.8.3",
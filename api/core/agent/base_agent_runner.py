@@ -1,10 +1,13 @@
 import json
 import logging
 import uuid
+from collections import defaultdict
 from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from typing import Optional, Union, cast
 
+from sqlalchemy import func
+
 from core.agent.entities import AgentEntity, AgentToolEntity
 from core.app.app_config.features.file_upload.manager import FileUploadConfigManager
 from core.app.apps.agent_chat.app_config_manager import AgentChatAppConfig
@@ -16,6 +19,7 @@ from core.app.entities.app_invoke_entities import (
 )
 from core.callback_handler.agent_tool_callback_handler import DifyAgentCallbackHandler
 from core.callback_handler.index_tool_callback_handler import DatasetIndexToolCallbackHandler
+from core.file.file_obj import FileExtraConfig
 from core.file.message_file_parser import MessageFileParser
 from core.memory.token_buffer_memory import TokenBufferMemory
 from core.model_manager import ModelInstance
@@ -42,7 +46,7 @@ from core.tools.tool.tool import Tool
 from core.tools.tool_manager import ToolManager
 from core.tools.utils.tool_parameter_converter import ToolParameterConverter
 from extensions.ext_database import db
-from models.model import Conversation, Message, MessageAgentThought
+from models.model import Conversation, Message, MessageAgentThought, MessageFile
 from models.tools import ToolConversationVariables
 
 logger = logging.getLogger(__name__)
@@ -118,27 +122,22 @@ class BaseAgentRunner(AppRunner):
         )
         # get how many agent thoughts have been created
         self.agent_thought_count = (
-            db.session.query(MessageAgentThought)
+            db.session.query(func.count(MessageAgentThought.id))
             .filter(
                 MessageAgentThought.message_id == self.message.id,
             )
-            .count()
+            .scalar()
         )
         db.session.close()
 
         # check if model supports stream tool call
         llm_model = cast(LargeLanguageModel, model_instance.model_type_instance)
         model_schema = llm_model.get_model_schema(model_instance.model, model_instance.credentials)
-        if model_schema and ModelFeature.STREAM_TOOL_CALL in (model_schema.features or []):
-            self.stream_tool_call = True
-        else:
-            self.stream_tool_call = False
+        features = frozenset(model_schema.features or ()) if model_schema else frozenset()
+        self.stream_tool_call = ModelFeature.STREAM_TOOL_CALL in features
 
         # check if model supports vision
-        if model_schema and ModelFeature.VISION in (model_schema.features or []):
-            self.files = application_generate_entity.files
-        else:
-            self.files = []
+        self.files = application_generate_entity.files if ModelFeature.VISION in features else []
         self.query = None
         self._current_thoughts: list[PromptMessage] = []
 
@@ -318,8 +317,11 @@ class BaseAgentRunner(AppRunner):
         )
 
         db.session.add(thought)
+        # the INSERT returns the generated id, so detach the loaded instance
+        # instead of expiring it on commit and selecting the row again
+        db.session.flush()
+        db.session.expunge(thought)
         db.session.commit()
-        db.session.refresh(thought)
         db.session.close()
 
         self.agent_thought_count += 1
@@ -431,11 +433,10 @@ class BaseAgentRunner(AppRunner):
         """
         Organize agent history
         """
-        result = []
         # check if there is a system message in the beginning of the conversation
-        for prompt_message in prompt_messages:
-            if isinstance(prompt_message, SystemPromptMessage):
-                result.append(prompt_message)
+        result: list[PromptMessage] = [
+            prompt_message for prompt_message in prompt_messages if isinstance(prompt_message, SystemPromptMessage)
+        ]
 
         messages: list[Message] = (
             db.session.query(Message)
@@ -447,13 +448,40 @@ class BaseAgentRunner(AppRunner):
         )
 
         messages = list(reversed(extract_thread_messages(messages)))
+        messages = [message for message in messages if message.id != self.message.id]
+
+        # load the agent thoughts and files of all history messages at once, instead of querying per message
+        agent_thoughts_by_message_id: dict[str, list[MessageAgentThought]] = defaultdict(list)
+        message_files_by_message_id: dict[str, list[MessageFile]] = defaultdict(list)
+        message_ids = [message.id for message in messages]
+        if message_ids:
+            agent_thoughts = (
+                db.session.query(MessageAgentThought)
+                .filter(MessageAgentThought.message_id.in_(message_ids))
+                .order_by(MessageAgentThought.position.asc())
+                .all()
+            )
+            for agent_thought in agent_thoughts:
+                agent_thoughts_by_message_id[agent_thought.message_id].append(agent_thought)
 
-        for message in messages:
-            if message.id == self.message.id:
-                continue
+            message_files = db.session.query(MessageFile).filter(MessageFile.message_id.in_(message_ids)).all()
+            for message_file in message_files:
+                message_files_by_message_id[message_file.message_id].append(message_file)
+
+        # all the history messages belong to the same conversation, so they share the file upload config
+        file_extra_config = None
+        if message_files_by_message_id:
+            file_extra_config = FileUploadConfigManager.convert(messages[0].app_model_config.to_dict())
 
-            result.append(self.organize_agent_user_prompt(message))
-            agent_thoughts: list[MessageAgentThought] = message.agent_thoughts
+        for message in messages:
+            result.append(
+                self.organize_agent_user_prompt(
+                    message,
+                    message_files=message_files_by_message_id.get(message.id, []),
+                    file_extra_config=file_extra_config,
+                )
+            )
+            agent_thoughts = agent_thoughts_by_message_id.get(message.id)
             if agent_thoughts:
                 for agent_thought in agent_thoughts:
                     tools = agent_thought.tool
@@ -491,15 +519,13 @@ class BaseAgentRunner(AppRunner):
                                 )
                             )
 
-                        result.extend(
-                            [
-                                AssistantPromptMessage(
-                                    content=agent_thought.thought,
-                                    tool_calls=tool_calls,
-                                ),
-                                *tool_call_response,
-                            ]
+                        result.append(
+                            AssistantPromptMessage(
+                                content=agent_thought.thought,
+                                tool_calls=tool_calls,
+                            )
                         )
+                        result.extend(tool_call_response)
                     if not tools:
                         result.append(AssistantPromptMessage(content=agent_thought.thought))
             else:
@@ -510,28 +536,25 @@ class BaseAgentRunner(AppRunner):
 
         return result
 
-    def organize_agent_user_prompt(self, message: Message) -> UserPromptMessage:
+    def organize_agent_user_prompt(
+        self,
+        message: Message,
+        message_files: list[MessageFile],
+        file_extra_config: Optional[FileExtraConfig],
+    ) -> UserPromptMessage:
+        if not message_files or not file_extra_config:
+            return UserPromptMessage(content=message.query)
+
         message_file_parser = MessageFileParser(
             tenant_id=self.tenant_id,
             app_id=self.app_config.app_id,
         )
+        file_objs = message_file_parser.transform_message_files(message_files, file_extra_config)
+        if not file_objs:
+            return UserPromptMessage(content=message.query)
 
-        files = message.message_files
-        if files:
-            file_extra_config = FileUploadConfigManager.convert(message.app_model_config.to_dict())
-
-            if file_extra_config:
-                file_objs = message_file_parser.transform_message_files(files, file_extra_config)
-            else:
-                file_objs = []
-
-            if not file_objs:
-                return UserPromptMessage(content=message.query)
-            else:
-                prompt_message_contents = [TextPromptMessageContent(data=message.query)]
-                for file_obj in file_objs:
-                    prompt_message_contents.append(file_obj.prompt_message_content)
+        prompt_message_contents = [TextPromptMessageContent(data=message.query)]
+        for file_obj in file_objs:
+            prompt_message_contents.append(file_obj.prompt_message_content)
 
-                return UserPromptMessage(content=prompt_message_contents)
-        else:
-            return UserPromptMessage(content=message.query)
+        return UserPromptMessage(content=prompt_message_contents)
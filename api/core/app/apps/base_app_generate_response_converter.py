@@ -8,6 +8,21 @@ from core.app.entities.task_entities import AppBlockingResponse, AppStreamRespon
 from core.errors.error import ModelCurrentlyNotSupportError, ProviderTokenNotInitError, QuotaExceededError
 from core.model_runtime.errors.invoke import InvokeError
 
+_ERROR_RESPONSES: dict[type[Exception], dict[str, Any]] = {
+    ValueError: {"code": "invalid_param", "status": 400},
+    ProviderTokenNotInitError: {"code": "provider_not_initialize", "status": 400},
+    QuotaExceededError: {
+        "code": "provider_quota_exceeded",
+        "message": "Your quota for Dify Hosted Model Provider has been exhausted. "
+        "Please go to Settings -> Model Provider to complete your own provider credentials.",
+        "status": 400,
+    },
+    ModelCurrentlyNotSupportError: {"code": "model_currently_not_support", "status": 400},
+    InvokeError: {"code": "completion_request_error", "status": 400},
+}
+
+_SIMPLE_RETRIEVER_RESOURCE_FIELDS = ("segment_id", "position", "document_name", "score", "content")
+
 
 class AppGenerateResponseConverter(ABC):
     _blocking_response_type: type[AppBlockingResponse]
@@ -74,28 +89,15 @@ class AppGenerateResponseConverter(ABC):
         :param metadata: metadata
         :return:
         """
+        # show annotation reply and usage only in full responses
+        metadata = {key: value for key, value in metadata.items() if key not in {"annotation_reply", "usage"}}
+
         # show_retrieve_source
-        updated_resources = []
         if "retriever_resources" in metadata:
-            for resource in metadata["retriever_resources"]:
-                updated_resources.append(
-                    {
-                        "segment_id": resource["segment_id"],
-                        "position": resource["position"],
-                        "document_name": resource["document_name"],
-                        "score": resource["score"],
-                        "content": resource["content"],
-                    }
-                )
-            metadata["retriever_resources"] = updated_resources
-
-        # show annotation reply
-        if "annotation_reply" in metadata:
-            del metadata["annotation_reply"]
-
-        # show usage
-        if "usage" in metadata:
-            del metadata["usage"]
+            metadata["retriever_resources"] = [
+                {field: resource[field] for field in _SIMPLE_RETRIEVER_RESOURCE_FIELDS}
+                for resource in metadata["retriever_resources"]
+            ]
 
         return metadata
 
@@ -106,24 +108,12 @@ class AppGenerateResponseConverter(ABC):
         :param e: exception
         :return:
         """
-        error_responses = {
-            ValueError: {"code": "invalid_param", "status": 400},
-            ProviderTokenNotInitError: {"code": "provider_not_initialize", "status": 400},
-            QuotaExceededError: {
-                "code": "provider_quota_exceeded",
-                "message": "Your quota for Dify Hosted Model Provider has been exhausted. "
-                "Please go to Settings -> Model Provider to complete your own provider credentials.",
-                "status": 400,
-            },
-            ModelCurrentlyNotSupportError: {"code": "model_currently_not_support", "status": 400},
-            InvokeError: {"code": "completion_request_error", "status": 400},
-        }
-
-        # Determine the response based on the type of exception
+        # Determine the response based on the most specific registered type of the exception
         data = None
-        for k, v in error_responses.items():
-            if isinstance(e, k):
-                data = v
+        for exception_type in type(e).__mro__:
+            if exception_type in _ERROR_RESPONSES:
+                data = dict(_ERROR_RESPONSES[exception_type])
+                break
 
         if data:
             data.setdefault("message", getattr(e, "description", str(e)))
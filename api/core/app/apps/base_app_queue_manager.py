@@ -5,6 +5,7 @@ from collections.abc import Generator
 from enum import Enum
 from typing import Any
 
+from pydantic import BaseModel
 from sqlalchemy.orm import DeclarativeMeta
 
 from configs import dify_config
@@ -48,8 +49,11 @@ class AppQueueManager:
         """
         # wait for APP_MAX_EXECUTION_TIME seconds to stop listen
         listen_timeout = dify_config.APP_MAX_EXECUTION_TIME
-        start_time = time.time()
+        start_time = time.monotonic()
         last_ping_time = 0
+        # the stop flag lives in redis, so it is checked at most once per second instead of once per message
+        last_stop_check_time = start_time - 1
+        stopped = False
         while True:
             try:
                 message = self._q.get(timeout=1)
@@ -60,8 +64,13 @@ class AppQueueManager:
             except queue.Empty:
                 continue
             finally:
-                elapsed_time = time.time() - start_time
-                if elapsed_time >= listen_timeout or self._is_stopped():
+                now = time.monotonic()
+                elapsed_time = now - start_time
+                if not stopped and now - last_stop_check_time >= 1:
+                    stopped = self._is_stopped()
+                    last_stop_check_time = now
+
+                if elapsed_time >= listen_timeout or stopped:
                     # publish two messages to make sure the client can receive the stop signal
                     # and stop listening after the stop signal processed
                     self.publish(
@@ -95,7 +104,7 @@ class AppQueueManager:
         :param pub_from:
         :return:
         """
-        self._check_for_sqlalchemy_models(event.model_dump())
+        self._check_for_sqlalchemy_models(event)
         self._publish(event, pub_from)
 
     @abstractmethod
@@ -156,13 +165,19 @@ class AppQueueManager:
         return f"generate_task_stopped:{task_id}"
 
     def _check_for_sqlalchemy_models(self, data: Any):
-        # from entity to dict or list
-        if isinstance(data, dict):
+        # walk the field values of entities, dicts and lists in place, without dumping the event
+        if isinstance(data, BaseModel):
+            for value in data.__dict__.values():
+                self._check_for_sqlalchemy_models(value)
+        elif isinstance(data, dict):
             for key, value in data.items():
                 self._check_for_sqlalchemy_models(value)
         elif isinstance(data, list):
             for item in data:
                 self._check_for_sqlalchemy_models(item)
+        elif data is None or isinstance(data, str | int | float | bool):
+            # most leaves are primitives, which skip the failing attribute lookup below
+            return
         else:
             if isinstance(data, DeclarativeMeta) or hasattr(data, "_sa_instance_state"):
                 raise TypeError(
@@ -8,9 +8,11 @@ import time
 
 import httpx
 
+from configs import dify_config
+
 SSRF_PROXY_ALL_URL = os.getenv("SSRF_PROXY_ALL_URL", "")
-SSRF_PROXY_HTTP_URL = os.getenv("SSRF_PROXY_HTTP_URL", "")
-SSRF_PROXY_HTTPS_URL = os.getenv("SSRF_PROXY_HTTPS_URL", "")
+SSRF_PROXY_HTTP_URL = dify_config.SSRF_PROXY_HTTP_URL
+SSRF_PROXY_HTTPS_URL = dify_config.SSRF_PROXY_HTTPS_URL
 SSRF_DEFAULT_MAX_RETRIES = int(os.getenv("SSRF_DEFAULT_MAX_RETRIES", "3"))
 
 proxies = (
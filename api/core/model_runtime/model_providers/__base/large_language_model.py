@@ -1,5 +1,4 @@
 import logging
-import os
 import re
 import time
 from abc import abstractmethod
@@ -9,7 +8,6 @@ from typing import Optional, Union
 from pydantic import ConfigDict
 
 from core.model_runtime.callbacks.base_callback import Callback
-from core.model_runtime.callbacks.logging_callback import LoggingCallback
 from core.model_runtime.entities.llm_entities import LLMMode, LLMResult, LLMResultChunk, LLMResultChunkDelta, LLMUsage
 from core.model_runtime.entities.message_entities import (
     AssistantPromptMessage,
@@ -77,9 +75,6 @@ class LargeLanguageModel(AIModel):
 
         callbacks = callbacks or []
 
-        if bool(os.environ.get("DEBUG", "False").lower() == "true"):
-            callbacks.append(LoggingCallback())
-
         # trigger before invoke callbacks
         self._trigger_before_invoke_callbacks(
             model=model,
@@ -1,11 +1,11 @@
 import json
 import logging
-import os
 from datetime import datetime, timedelta
 from typing import Optional
 
 from langfuse import Langfuse
 
+from configs import dify_config
 from core.ops.base_trace_instance import BaseTraceInstance
 from core.ops.entities.config_entity import LangfuseConfig
 from core.ops.entities.trace_entity import (
@@ -46,7 +46,7 @@ class LangFuseDataTrace(BaseTraceInstance):
             secret_key=langfuse_config.secret_key,
             host=langfuse_config.host,
         )
-        self.file_base_url = os.getenv("FILES_URL", "http://127.0.0.1:5001")
+        self.file_base_url = dify_config.FILES_URL
 
     def trace(self, trace_info: BaseTraceInfo):
         if isinstance(trace_info, WorkflowTraceInfo):
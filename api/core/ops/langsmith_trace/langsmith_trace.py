@@ -1,12 +1,12 @@
 import json
 import logging
-import os
 import uuid
 from datetime import datetime, timedelta
 
 from langsmith import Client
 from langsmith.schemas import RunBase
 
+from configs import dify_config
 from core.ops.base_trace_instance import BaseTraceInstance
 from core.ops.entities.config_entity import LangSmithConfig
 from core.ops.entities.trace_entity import (
@@ -43,7 +43,7 @@ class LangSmithDataTrace(BaseTraceInstance):
         self.project_name = langsmith_config.project
         self.project_id = None
         self.langsmith_client = Client(api_key=langsmith_config.api_key, api_url=langsmith_config.endpoint)
-        self.file_base_url = os.getenv("FILES_URL", "http://127.0.0.1:5001")
+        self.file_base_url = dify_config.FILES_URL
 
     def trace(self, trace_info: BaseTraceInfo):
         if isinstance(trace_info, WorkflowTraceInfo):
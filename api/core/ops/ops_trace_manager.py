@@ -10,6 +10,7 @@ from uuid import UUID
 
 from flask import current_app
 
+from configs import dify_config
 from core.helper.encrypter import decrypt_token, encrypt_token, obfuscated_token
 from core.ops.entities.config_entity import (
     LangfuseConfig,
@@ -319,7 +320,7 @@ class TraceTask:
         self.user_id = user_id
         self.timer = timer
         self.kwargs = kwargs
-        self.file_base_url = os.getenv("FILES_URL", "http://127.0.0.1:5001")
+        self.file_base_url = dify_config.FILES_URL
 
         self.app_id = None
 
@@ -20,10 +20,14 @@ if [[ "${MODE}" == "worker" ]]; then
     CONCURRENCY_OPTION="-c ${CELERY_WORKER_AMOUNT:-1}"
   fi
 
+  # Celery workers serve no HTTP requests, skip loading the controllers
+  export ENABLED_BLUEPRINTS=""
+
   exec celery -A app.celery worker -P ${CELERY_WORKER_CLASS:-gevent} $CONCURRENCY_OPTION --loglevel ${LOG_LEVEL} \
     -Q ${CELERY_QUEUES:-dataset,generation,mail,ops_trace,app_deletion}
 
 elif [[ "${MODE}" == "beat" ]]; then
+  export ENABLED_BLUEPRINTS=""
   exec celery -A app.celery beat --loglevel ${LOG_LEVEL}
 else
   if [[ "${DEBUG}" == "true" ]]; then
@@ -53,6 +53,35 @@ def init_app(app: Flask) -> Celery:
     imports = [
         "schedule.clean_embedding_cache_task",
         "schedule.clean_unused_datasets_task",
+        # all task modules are registered here, workers may not import the controllers or services using them
+        "tasks.add_document_to_index_task",
+        "tasks.annotation.add_annotation_to_index_task",
+        "tasks.annotation.batch_import_annotations_task",
+        "tasks.annotation.delete_annotation_index_task",
+        "tasks.annotation.disable_annotation_reply_task",
+        "tasks.annotation.enable_annotation_reply_task",
+        "tasks.annotation.update_annotation_to_index_task",
+        "tasks.batch_create_segment_to_index_task",
+        "tasks.clean_dataset_task",
+        "tasks.clean_document_task",
+        "tasks.clean_notion_document_task",
+        "tasks.create_segment_to_index_task",
+        "tasks.deal_dataset_vector_index_task",
+        "tasks.delete_segment_from_index_task",
+        "tasks.disable_segment_from_index_task",
+        "tasks.document_indexing_sync_task",
+        "tasks.document_indexing_task",
+        "tasks.document_indexing_update_task",
+        "tasks.duplicate_document_indexing_task",
+        "tasks.enable_segment_to_index_task",
+        "tasks.mail_invite_member_task",
+        "tasks.mail_reset_password_task",
+        "tasks.ops_trace_task",
+        "tasks.recover_document_indexing_task",
+        "tasks.remove_app_and_related_data_task",
+        "tasks.remove_document_from_index_task",
+        "tasks.retry_document_indexing_task",
+        "tasks.sync_website_document_indexing_task",
     ]
     day = app.config.get("CELERY_BEAT_SCHEDULER_TIME")
     beat_schedule = {
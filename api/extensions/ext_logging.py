@@ -0,0 +1,110 @@
+import atexit
+import logging
+import os
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from zoneinfo import ZoneInfo
+
+from flask import Flask
+from gevent import monkey
+
+
+class NativeThreadQueueListener(QueueListener):
+    """
+    QueueListener running on a native OS thread with a native queue.
+    With gevent monkey patching, a regular listener thread is a greenlet on the same hub,
+    so its blocking file writes would still stall every request greenlet.
+    """
+
+    def __init__(self, *handlers: logging.Handler):
+        super().__init__(monkey.get_original("queue", "SimpleQueue")(), *handlers, respect_handler_level=True)
+        for handler in handlers:
+            # the handlers are only used by the listener thread, which can't use gevent locks
+            handler.lock = monkey.get_original("_thread", "RLock")()
+        self._stopped = None
+
+    def start(self):
+        allocate_lock = monkey.get_original("_thread", "allocate_lock")
+        start_new_thread = monkey.get_original("_thread", "start_new_thread")
+        self._stopped = allocate_lock()
+        self._stopped.acquire()
+        start_new_thread(self._run, ())
+
+    def _run(self):
+        try:
+            self._monitor()
+        finally:
+            self._stopped.release()
+
+    def stop(self):
+        if self._stopped is None:
+            return
+        self.enqueue_sentinel()
+        self._stopped.acquire()
+        self._stopped = None
+
+    def restart_after_fork(self):
+        # the listener thread is not inherited by forked workers (e.g. gunicorn --preload),
+        # and the records queued before the fork are written by the parent process
+        self._stopped = None
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.start()
+
+
+def init_app(app: Flask):
+    log_handlers = None
+    log_file = app.config.get("LOG_FILE")
+    if log_file:
+        log_dir = os.path.dirname(log_file)
+        os.makedirs(log_dir, exist_ok=True)
+        # file and stdout writes are done by the listener thread,
+        # so request handlers only pay for putting the record into a queue.
+        # Records are formatted by the QueueHandler, the listener handlers keep the default formatter.
+        listener = NativeThreadQueueListener(
+            RotatingFileHandler(
+                filename=log_file,
+                maxBytes=1024 * 1024 * 1024,
+                backupCount=5,
+            ),
+            logging.StreamHandler(sys.stdout),
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=listener.restart_after_fork)
+        log_handlers = [QueueHandler(listener.queue)]
+
+    logging.basicConfig(
+        level=app.config.get("LOG_LEVEL"),
+        format=app.config.get("LOG_FORMAT"),
+        datefmt=app.config.get("LOG_DATEFORMAT"),
+        handlers=log_handlers,
+        force=True,
+    )
+    log_tz = app.config.get("LOG_TZ")
+    if log_tz:
+        time_converter = get_time_converter(log_tz)
+        for handler in logging.root.handlers:
+            handler.formatter.converter = time_converter
+
+
+def get_time_converter(timezone_name: str) -> Callable[[float], time.struct_time]:
+    """
+    Build a converter from epoch seconds to the local time of the timezone, for logging.Formatter.converter.
+    The utc offset is resolved at most once per minute, which still follows DST transitions.
+    """
+    timezone = ZoneInfo(timezone_name)
+    offset_cache = {"minute": None, "offset": 0.0}
+
+    def time_converter(seconds: float) -> time.struct_time:
+        minute = int(seconds // 60)
+        if offset_cache["minute"] != minute:
+            offset_cache["offset"] = datetime.fromtimestamp(seconds, timezone).utcoffset().total_seconds()
+            offset_cache["minute"] = minute
+        return time.gmtime(seconds + offset_cache["offset"])
+
+    return time_converter
@@ -1,8 +1,13 @@
+import re
+
 import jwt
 from werkzeug.exceptions import Unauthorized
 
 from configs import dify_config
 
+# case-insensitive "Bearer <token>" authorization header, the scheme and token are separated by spaces
+BEARER_TOKEN_PATTERN = re.compile(r"bearer +(\S.*)", re.IGNORECASE)
+
 
 class PassportService:
     def __init__(self):
@@ -3,6 +3,7 @@ from textwrap import dedent
 
 import pytest
 from flask import Flask
+from pydantic import ValidationError
 from yarl import URL
 
 from configs.app_config import DifyConfig
@@ -93,5 +94,52 @@ def test_flask_configs(example_env_file):
     assert config["CONSOLE_CORS_ALLOW_ORIGINS"] == ["https://example.com"]
     assert config["WEB_API_CORS_ALLOW_ORIGINS"] == ["*"]
 
-    assert str(config["CODE_EXECUTION_ENDPOINT"]) == "http://sandbox:8194/"
+    assert config["CODE_EXECUTION_ENDPOINT"] == "http://sandbox:8194"
     assert str(URL(str(config["CODE_EXECUTION_ENDPOINT"])) / "v1") == "http://sandbox:8194/v1"
+
+
+def test_enabled_blueprints(example_env_file, monkeypatch):
+    # all blueprints are enabled by default
+    config = DifyConfig(_env_file=example_env_file)
+    assert config.ENABLED_BLUEPRINTS == ["console", "web", "service_api", "files", "inner_api"]
+
+    monkeypatch.setenv("ENABLED_BLUEPRINTS", " console, files ,")
+    config = DifyConfig(_env_file=example_env_file)
+    assert config.ENABLED_BLUEPRINTS == ["console", "files"]
+
+    # processes serving no HTTP requests can skip all blueprints
+    monkeypatch.setenv("ENABLED_BLUEPRINTS", "")
+    config = DifyConfig(_env_file=example_env_file)
+    assert config.ENABLED_BLUEPRINTS == []
+
+
+def test_position_configs_are_parsed_once(example_env_file, monkeypatch):
+    monkeypatch.setenv("POSITION_TOOL_PINS", " google, ,bing")
+    monkeypatch.setenv("POSITION_PROVIDER_EXCLUDES", "openai,")
+    config = DifyConfig(_env_file=example_env_file)
+    assert config.POSITION_TOOL_PINS_LIST == ["google", "bing"]
+    assert config.POSITION_PROVIDER_EXCLUDES_SET == {"openai"}
+    assert config.POSITION_PROVIDER_INCLUDES_SET == set()
+    assert config.POSITION_TOOL_PINS_LIST is config.POSITION_TOOL_PINS_LIST
+    assert config.model_dump()["POSITION_TOOL_PINS_LIST"] == ["google", "bing"]
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("ETL_TYPE", "unstructured"),
+        ("HOSTED_FETCH_APP_TEMPLATES_MODE", "local"),
+        ("KEYWORD_STORE", "bm25"),
+        ("S3_ADDRESS_STYLE", "virtual-hosted"),
+    ],
+)
+def test_invalid_choice_configs(example_env_file, monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        DifyConfig(_env_file=example_env_file)
+
+
+def test_invalid_code_execution_endpoint(example_env_file, monkeypatch):
+    monkeypatch.setenv("CODE_EXECUTION_ENDPOINT", "sandbox:8194")
+    with pytest.raises(ValidationError):
+        DifyConfig(_env_file=example_env_file)
@@ -0,0 +1,75 @@
+from core.agent.base_agent_runner import BaseAgentRunner
+from core.model_runtime.entities.message_entities import (
+    AssistantPromptMessage,
+    SystemPromptMessage,
+    ToolPromptMessage,
+    UserPromptMessage,
+)
+from models.model import Message, MessageAgentThought, MessageFile
+
+
+def _mock_db(mocker, results: dict):
+    def query(model):
+        query_mock = mocker.MagicMock()
+        query_mock.filter.return_value = query_mock
+        query_mock.order_by.return_value = query_mock
+        query_mock.all.return_value = results[model]
+        return query_mock
+
+    db = mocker.patch("core.agent.base_agent_runner.db")
+    db.session.query.side_effect = query
+    return db
+
+
+def _make_runner(mocker, message: Message) -> BaseAgentRunner:
+    runner = BaseAgentRunner.__new__(BaseAgentRunner)
+    runner.tenant_id = "tenant_id"
+    runner.app_config = mocker.MagicMock(app_id="app_id")
+    runner.message = message
+    return runner
+
+
+def test_organize_agent_history(mocker):
+    first = Message(id="m1", conversation_id="c1", query="hello", answer="hi", parent_message_id=None)
+    second = Message(id="m2", conversation_id="c1", query="search it", answer="found", parent_message_id="m1")
+    current = Message(id="m3", conversation_id="c1", query="thanks", answer="", parent_message_id="m2")
+    agent_thought = MessageAgentThought(
+        message_id="m2",
+        position=1,
+        thought="let me search",
+        tool="search",
+        tool_input='{"search": {"query": "it"}}',
+        observation='{"search": "result"}',
+    )
+    db = _mock_db(
+        mocker,
+        {
+            Message: [current, second, first],
+            MessageAgentThought: [agent_thought],
+            MessageFile: [],
+        },
+    )
+    runner = _make_runner(mocker, current)
+
+    result = runner.organize_agent_history([SystemPromptMessage(content="system"), UserPromptMessage(content="q")])
+
+    assert [type(prompt_message) for prompt_message in result] == [
+        SystemPromptMessage,
+        UserPromptMessage,
+        AssistantPromptMessage,
+        UserPromptMessage,
+        AssistantPromptMessage,
+        ToolPromptMessage,
+    ]
+    assert result[1].content == "hello"
+    assert result[2].content == "hi"
+    assert result[3].content == "search it"
+    assert result[4].content == "let me search"
+    tool_call = result[4].tool_calls[0]
+    assert tool_call.function.name == "search"
+    assert tool_call.function.arguments == '{"query": "it"}'
+    assert result[5].content == "result"
+    assert result[5].tool_call_id == tool_call.id
+
+    # the thoughts and files of all history messages are loaded at once
+    assert db.session.query.call_count == 3
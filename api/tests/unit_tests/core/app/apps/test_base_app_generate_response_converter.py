@@ -0,0 +1,50 @@
+from core.app.apps.base_app_generate_response_converter import AppGenerateResponseConverter
+from core.errors.error import QuotaExceededError
+from core.model_runtime.errors.invoke import InvokeRateLimitError
+
+
+def test_error_to_stream_response():
+    data = AppGenerateResponseConverter._error_to_stream_response(InvokeRateLimitError("rate limited"))
+    assert data == {"code": "completion_request_error", "message": "rate limited", "status": 400}
+
+    data = AppGenerateResponseConverter._error_to_stream_response(ValueError("first"))
+    assert data == {"code": "invalid_param", "message": "first", "status": 400}
+    # the registered response is not changed by a previous error
+    data = AppGenerateResponseConverter._error_to_stream_response(ValueError("second"))
+    assert data["message"] == "second"
+
+    data = AppGenerateResponseConverter._error_to_stream_response(QuotaExceededError())
+    assert data["code"] == "provider_quota_exceeded"
+    assert data["message"].startswith("Your quota for Dify Hosted Model Provider has been exhausted.")
+
+    data = AppGenerateResponseConverter._error_to_stream_response(RuntimeError("unexpected"))
+    assert data["code"] == "internal_server_error"
+    assert data["status"] == 500
+
+
+def test_get_simple_metadata():
+    resource = {
+        "dataset_id": "dataset_id",
+        "segment_id": "segment_id",
+        "position": 1,
+        "document_name": "document.txt",
+        "score": 0.9,
+        "content": "content",
+    }
+    metadata = {"retriever_resources": [resource], "annotation_reply": {"id": "id"}, "usage": {"total_tokens": 1}}
+
+    simple_metadata = AppGenerateResponseConverter._get_simple_metadata(metadata)
+
+    assert simple_metadata == {
+        "retriever_resources": [
+            {
+                "segment_id": "segment_id",
+                "position": 1,
+                "document_name": "document.txt",
+                "score": 0.9,
+                "content": "content",
+            }
+        ]
+    }
+    assert metadata["retriever_resources"] == [resource]
+    assert "usage" in metadata
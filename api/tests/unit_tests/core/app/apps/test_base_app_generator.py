@@ -0,0 +1,24 @@
+from core.app.app_config.entities import AppAdditionalFeatures, AppConfig, VariableEntity, VariableEntityType
+from core.app.apps.base_app_generator import BaseAppGenerator
+from models.model import AppMode
+
+
+def test_get_cleaned_inputs():
+    app_config = AppConfig(
+        tenant_id="tenant_id",
+        app_id="app_id",
+        app_mode=AppMode.WORKFLOW,
+        additional_features=AppAdditionalFeatures(),
+        variables=[
+            VariableEntity(variable="name", label="name", type=VariableEntityType.TEXT_INPUT, required=True),
+            VariableEntity(variable="count", label="count", type=VariableEntityType.NUMBER),
+            VariableEntity(variable="ratio", label="ratio", type=VariableEntityType.NUMBER),
+            VariableEntity(variable="note", label="note", type=VariableEntityType.PARAGRAPH, default="none"),
+        ],
+    )
+
+    cleaned_inputs = BaseAppGenerator()._get_cleaned_inputs(
+        {"name": "dify\x00", "count": "3", "ratio": "0.5", "ignored": "value"}, app_config
+    )
+
+    assert cleaned_inputs == {"name": "dify", "count": 3, "ratio": 0.5, "note": "none"}
@@ -0,0 +1,55 @@
+import pytest
+
+from core.app.apps.base_app_queue_manager import AppQueueManager, PublishFrom
+from core.app.entities.app_invoke_entities import InvokeFrom
+from core.app.entities.queue_entities import AppQueueEvent, QueueErrorEvent, QueueStopEvent, QueueTextChunkEvent
+from models.model import Message
+
+
+class _QueueManager(AppQueueManager):
+    def _publish(self, event: AppQueueEvent, pub_from: PublishFrom) -> None:
+        self._q.put(event)
+
+
+def test_listen_checks_stop_flag_once_per_second(mocker):
+    redis_client = mocker.patch("core.app.apps.base_app_queue_manager.redis_client", new=mocker.MagicMock())
+    redis_client.get.return_value = None
+    queue_manager = _QueueManager(task_id="task_id", user_id="user_id", invoke_from=InvokeFrom.SERVICE_API)
+    for _ in range(100):
+        queue_manager.publish(QueueTextChunkEvent(text="chunk"), PublishFrom.APPLICATION_MANAGER)
+    queue_manager.stop_listen()
+
+    events = list(queue_manager.listen())
+
+    assert len(events) == 100
+    assert redis_client.get.call_count == 1
+
+
+def test_listen_publishes_stop_event_when_stopped(mocker):
+    redis_client = mocker.patch("core.app.apps.base_app_queue_manager.redis_client", new=mocker.MagicMock())
+    redis_client.get.return_value = b"1"
+    queue_manager = _QueueManager(task_id="task_id", user_id="user_id", invoke_from=InvokeFrom.SERVICE_API)
+    queue_manager.publish(QueueTextChunkEvent(text="chunk"), PublishFrom.APPLICATION_MANAGER)
+
+    listener = queue_manager.listen()
+
+    assert isinstance(next(listener), QueueTextChunkEvent)
+    assert isinstance(next(listener), QueueStopEvent)
+
+
+def test_publish_rejects_sqlalchemy_models(mocker):
+    mocker.patch("core.app.apps.base_app_queue_manager.redis_client", new=mocker.MagicMock())
+    queue_manager = _QueueManager(task_id="task_id", user_id="user_id", invoke_from=InvokeFrom.SERVICE_API)
+
+    with pytest.raises(TypeError):
+        queue_manager.publish(QueueErrorEvent(error={"message": Message(id="id")}), PublishFrom.APPLICATION_MANAGER)
+
+
+def test_publish_does_not_dump_events(mocker):
+    mocker.patch("core.app.apps.base_app_queue_manager.redis_client", new=mocker.MagicMock())
+    model_dump = mocker.patch.object(QueueTextChunkEvent, "model_dump")
+    queue_manager = _QueueManager(task_id="task_id", user_id="user_id", invoke_from=InvokeFrom.SERVICE_API)
+
+    queue_manager.publish(QueueTextChunkEvent(text="chunk"), PublishFrom.APPLICATION_MANAGER)
+
+    model_dump.assert_not_called()
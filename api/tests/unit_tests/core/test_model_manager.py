@@ -3,8 +3,10 @@ from unittest.mock import MagicMock
 import pytest
 
 from core.entities.provider_entities import ModelLoadBalancingConfiguration
-from core.model_manager import LBModelManager
+from core.model_manager import LBModelManager, ModelInstance
+from core.model_runtime.callbacks.logging_callback import LoggingCallback
 from core.model_runtime.entities.model_entities import ModelType
+from core.model_runtime.model_providers.__base.large_language_model import LargeLanguageModel
 
 
 @pytest.fixture
@@ -64,3 +66,18 @@ def test_lb_model_manager_fetch_next(mocker, lb_model_manager):
 
     config = lb_model_manager.fetch_next()
     assert config == config3
+
+
+@pytest.mark.parametrize("debug", [True, False])
+def test_invoke_llm_adds_logging_callback_in_debug_mode(mocker, debug):
+    mocker.patch("core.model_manager.dify_config", MagicMock(DEBUG=debug))
+    mocker.patch.object(ModelInstance, "_fetch_credentials_from_bundle", return_value={})
+    mocker.patch.object(ModelInstance, "_get_load_balancing_manager", return_value=None)
+    provider_model_bundle = MagicMock()
+    provider_model_bundle.model_type_instance = MagicMock(spec=LargeLanguageModel)
+    model_instance = ModelInstance(provider_model_bundle=provider_model_bundle, model="gpt-4")
+
+    model_instance.invoke_llm(prompt_messages=[], callbacks=[])
+
+    callbacks = provider_model_bundle.model_type_instance.invoke.call_args.kwargs["callbacks"]
+    assert any(isinstance(callback, LoggingCallback) for callback in callbacks) is debug
@@ -0,0 +1,53 @@
+import logging
+from logging.handlers import QueueHandler
+
+from extensions.ext_logging import NativeThreadQueueListener, get_time_converter
+
+
+def test_queue_listener_writes_records_to_file(tmp_path):
+    log_file = tmp_path / "dify.log"
+    file_handler = logging.FileHandler(log_file)
+    listener = NativeThreadQueueListener(file_handler)
+    listener.start()
+
+    queue_handler = QueueHandler(listener.queue)
+    queue_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    logger = logging.getLogger("test_queue_listener_writes_records_to_file")
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    try:
+        logger.warning("hello %s", "dify")
+    finally:
+        logger.removeHandler(queue_handler)
+        # stopping the listener waits until all queued records are handled
+        listener.stop()
+        file_handler.close()
+
+    assert log_file.read_text() == "WARNING - hello dify\n"
+
+
+def test_queue_listener_stop_is_idempotent():
+    listener = NativeThreadQueueListener(logging.NullHandler())
+    listener.start()
+    listener.stop()
+    listener.stop()
+
+
+def test_time_converter_follows_dst_transition():
+    time_converter = get_time_converter("America/New_York")
+
+    # 2024-03-10 06:59:00 UTC, one minute before the switch to EDT
+    assert time_converter(1710053940)[:6] == (2024, 3, 10, 1, 59, 0)
+    # 2024-03-10 07:00:00 UTC, clocks jump from 02:00 EST to 03:00 EDT
+    assert time_converter(1710054000)[:6] == (2024, 3, 10, 3, 0, 0)
+    # 2024-11-03 06:00:00 UTC, clocks go back from 02:00 EDT to 01:00 EST
+    assert time_converter(1730613540)[:6] == (2024, 11, 3, 1, 59, 0)
+    assert time_converter(1730613600)[:6] == (2024, 11, 3, 1, 0, 0)
+
+
+def test_time_converter_without_dst():
+    time_converter = get_time_converter("Asia/Shanghai")
+
+    # 2024-01-01 00:00:00 UTC and 2024-07-01 00:00:00 UTC
+    assert time_converter(1704067200)[:6] == (2024, 1, 1, 8, 0, 0)
+    assert time_converter(1719792000)[:6] == (2024, 7, 1, 8, 0, 0)
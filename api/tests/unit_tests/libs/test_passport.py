@@ -0,0 +1,39 @@
+import pytest
+
+from libs.passport import BEARER_TOKEN_PATTERN
+
+
+@pytest.mark.parametrize(
+    ("auth_header", "expected_token"),
+    [
+        ("Bearer abc.def.ghi", "abc.def.ghi"),
+        # the scheme is case-insensitive
+        ("bearer abc", "abc"),
+        ("BEARER abc", "abc"),
+        # extra spaces between the scheme and the token
+        ("Bearer   abc", "abc"),
+        ("Bearer abc ", "abc "),
+    ],
+)
+def test_bearer_token_pattern_matches(auth_header, expected_token):
+    match = BEARER_TOKEN_PATTERN.fullmatch(auth_header)
+    assert match
+    assert match.group(1) == expected_token
+
+
+@pytest.mark.parametrize(
+    "auth_header",
+    [
+        # missing token
+        "Bearer",
+        "Bearer ",
+        "Bearer   ",
+        # wrong scheme
+        "Basic abc",
+        "Bearerabc",
+        # only spaces are accepted as separator
+        "Bearer\tabc",
+    ],
+)
+def test_bearer_token_pattern_rejects(auth_header):
+    assert BEARER_TOKEN_PATTERN.fullmatch(auth_header) is None
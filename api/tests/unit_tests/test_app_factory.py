@@ -0,0 +1,15 @@
+import os
+
+from app_factory import create_flask_app_with_configs
+from configs import dify_config
+
+
+def test_create_flask_app_with_configs_does_not_change_environ():
+    environ_before = dict(os.environ)
+
+    app = create_flask_app_with_configs()
+
+    assert app.config["EDITION"] == dify_config.EDITION
+    assert app.config["DEBUG"] == dify_config.DEBUG
+    # configs are read from dify_config, not mirrored into the environment variables
+    assert dict(os.environ) == environ_before